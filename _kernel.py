@@ -0,0 +1,76 @@
+"""Compiled great-circle distance kernels used by final.py. """
+
+from math import asin, cos, sin, sqrt
+
+from numba import njit, prange
+
+EARTH_RADIUS_KM = 6371.0088
+EARTH_RADIUS_MI = 3958.7613
+_DEG_TO_RAD = 0.017453292519943295
+
+
+@njit(cache=True, fastmath=True)
+def haversine_km(lat1, lng1, lat2, lng2):
+    """Calculates the haversine distance between two latitude/longitude
+    coordinates.
+    
+    Args:
+        lat1 (float): latitude of the first location in degrees.
+        lng1 (float): longitude of the first location in degrees.
+        lat2 (float): latitude of the second location in degrees.
+        lng2 (float): longitude of the second location in degrees.
+        
+    Returns:
+        float: the distance between the two locations in kilometers. """
+        
+    rlat1 = lat1 * _DEG_TO_RAD
+    rlat2 = lat2 * _DEG_TO_RAD
+    dlat = rlat2 - rlat1
+    dlng = (lng2 - lng1) * _DEG_TO_RAD
+    a = sin(dlat / 2) ** 2 + cos(rlat1) * cos(rlat2) * sin(dlng / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(a))
+
+
+@njit(cache=True, fastmath=True, boundscheck=False)
+def nearest_site(lat1, lng1, vlat, vlng, vcoslat):
+    """Finds the closest site to a point by scanning every site, keeping only
+    the running minimum instead of an array of distances.
+    
+    Args:
+        lat1 (float): latitude of the point in radians.
+        lng1 (float): longitude of the point in radians.
+        vlat (array of float): latitude of every site in radians.
+        vlng (array of float): longitude of every site in radians.
+        vcoslat (array of float): cosine of every site latitude.
+        
+    Returns:
+        int: index of the nearest site. """
+        
+    # Ranks by the haversine term, which grows with distance. The law of
+    # cosines form loses km-scale resolution on float32 site arrays.
+    coslat1 = cos(lat1)
+    best = 2.0
+    idx = 0
+    for j in range(vlat.shape[0]):
+        a = (sin((vlat[j] - lat1) * 0.5) ** 2
+             + coslat1 * vcoslat[j] * sin((vlng[j] - lng1) * 0.5) ** 2)
+        if a < best:
+            best = a
+            idx = j
+    return idx
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def nearest_sites_batch(plat, plng, vlat, vlng, vcoslat, out):
+    """Runs nearest_site for every point in parallel, spreading the points
+    across NUMBA_NUM_THREADS threads.
+    
+    Args:
+        plat (array of float): latitude of every point in radians.
+        plng (array of float): longitude of every point in radians.
+        vlat, vlng, vcoslat (array of float): See nearest_site.
+        out (array of int): Receives the index of each point's nearest
+        site. """
+        
+    for i in prange(plat.shape[0]):
+        out[i] = nearest_site(plat[i], plng[i], vlat, vlng, vcoslat)
@@ -1,13 +1,177 @@
 """Uses COVID-19 information and provides vaccine eligibility, vaccine sites, 
 and data visualization of vaccine information. """
 
+from collections.abc import Mapping
+from dataclasses import dataclass
+import argparse
+import functools
+import os
+import sys
+import zipfile
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-from haversine import haversine
-from vincenty import vincenty
-import sys
-import combined
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+from scipy.spatial import cKDTree
+from _kernel import (EARTH_RADIUS_KM, EARTH_RADIUS_MI, haversine_km,
+                     nearest_site, nearest_sites_batch)
+
+def _isin_codes(column, values):
+    """Tests membership of a categorical column by comparing integer codes
+    instead of strings.
+    
+    Args:
+        column (Series): A categorical column.
+        values (list of str): The values to look for.
+        
+    Returns:
+        array of bool: True where the column holds one of the values. """
+        
+    codes = column.cat.categories.get_indexer(values)
+    return np.isin(column.cat.codes.to_numpy(), codes[codes >= 0])
+
+# Below this many vaccine sites a compiled linear scan beats a tree query.
+_SCAN_MAX_SITES = 256
+# Below this many zipcodes a batch lookup is not worth starting threads for.
+_PARALLEL_MIN_QUERIES = 64
+
+_PHASE1_JOBS = frozenset({"doctor", "nurse", "therapist"})
+_PHASE2_JOBS = frozenset({"cashier", "teacher"})
+_PHASES = tuple(map(sys.intern, ("phase 1", "phase 2", "phase 3")))
+
+def _cache_is_fresh(cache, source):
+    """Checks whether a cache file exists and is newer than its source.
+    
+    Args:
+        cache (str): Path of the cache file.
+        source (str): Path of the file the cache was built from.
+        
+    Returns:
+        bool: True if the cache can be used in place of parsing source. """
+        
+    return (os.path.exists(cache)
+            and os.path.getmtime(cache) >= os.path.getmtime(source))
+
+def _read_cache(cache, source, load):
+    """Loads a cache file if it is fresh and readable.
+    
+    Args:
+        cache (str): Path of the cache file.
+        source (str): Path of the file the cache was built from.
+        load (function): Reads the cache contents from an open binary file.
+        
+    Returns:
+        The result of load, or None if the cache is stale, missing or 
+        damaged, in which case source should be parsed again. """
+        
+    if not _cache_is_fresh(cache, source):
+        return None
+    try:
+        with open(cache, "rb") as f:
+            return load(f)
+    except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+def _write_cache(cache, dump):
+    """Writes a cache file atomically, so an interrupted write never leaves a
+    partial file behind that looks fresh. Failing to write is not an error.
+    
+    Args:
+        cache (str): Path of the cache file.
+        dump (function): Writes the cache contents to an open binary file. """
+        
+    tmp = f"{cache}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            dump(f)
+        os.replace(tmp, cache)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+def _load_zip_arrays(f):
+    """Reads the zipcode keys, latitudes and longitudes from a .npz cache.
+    
+    Args:
+        f (file): The open cache file.
+        
+    Returns:
+        tuple of array: zipcodes, latitudes and longitudes. """
+        
+    with np.load(f, allow_pickle=False) as data:
+        return (data["zip"], data["lat"].astype(np.float32, copy=False),
+                data["lng"].astype(np.float32, copy=False))
+
+def _read_columns(file, columns):
+    """Reads a headerless comma separated file with the pyarrow CSV reader.
+    
+    Args:
+        file (str): The file to read.
+        columns (dict): Maps each column name, in file order, to its pyarrow
+        type.
+        
+    Returns:
+        dict of array: Maps each column name to a numpy array. String columns
+        have surrounding whitespace removed. An empty file gives empty 
+        arrays. """
+        
+    if os.path.getsize(file) == 0:
+        # pyarrow rejects a file with no bytes at all.
+        table = pa.table({name: pa.array([], type=kind)
+                          for name, kind in columns.items()})
+    else:
+        table = pacsv.read_csv(
+            file, read_options=pacsv.ReadOptions(column_names=list(columns)),
+            convert_options=pacsv.ConvertOptions(column_types=columns))
+    arrays = {}
+    for name, kind in columns.items():
+        column = table.column(name)
+        if kind == pa.string():
+            arrays[name] = pc.utf8_trim_whitespace(column).to_numpy(
+                zero_copy_only=False).astype(str)
+        else:
+            arrays[name] = column.to_numpy()
+    return arrays
+
+def _check_latlng(lat, lng, file):
+    """Rejects coordinates that cannot be a latitude and longitude.
+    
+    Args:
+        lat (array of float): latitudes in degrees.
+        lng (array of float): longitudes in degrees.
+        file (str): The file the coordinates were read from.
+        
+    Raises:
+        ValueError: if any latitude is outside [-90, 90] or any longitude is
+        outside [-180, 180]. """
+        
+    if np.any(np.abs(lat) > 90) or np.any(np.abs(lng) > 180):
+        raise ValueError(f"{file} contains coordinates outside the valid "
+                         "latitude/longitude range")
+
+class _InfoView(Mapping):
+    """Read-only dictionary view over the rows of an Eligibility DataFrame.
+    
+    Each value is the tuple (name, age, immunocompromised, job, preference,
+    zipcode, phase), matching the layout Eligibility.info has always had. """
+    
+    def __init__(self, df):
+        self._df = df
+        
+    def __getitem__(self, name):
+        row = self._df.loc[name]
+        return (name, int(row["age"]), *row.iloc[1:].tolist())
+    
+    def __iter__(self):
+        return iter(self._df.index)
+    
+    def __len__(self):
+        return len(self._df)
 
 class Eligibility:
     """Takes in a file and uses the information from the file to tell each 
@@ -15,31 +179,40 @@ class Eligibility:
     vaccine. 
     
     Attributes:
-        file (filepath): The filepath in which the file is open and parsed.
+        df (DataFrame): The information in the file indexed by name. The 
+        columns are age, immunocompromised, job, preference, zipcode and 
+        phase. 
         
-        info(dict): A dictionary of information in the file. This consists of 
-        the individuals name, age, immunocompromised status, vaccine status
-        job and zipcode. """
+        info(dict): A dictionary view of df. This consists of the individuals 
+        name, age, immunocompromised status, job, vaccine status, zipcode and
+        phase. """
         
     def __init__(self, file):
-        """Takes in file and puts all of the information in a dictionary. 
+        """Takes in file and puts all of the information in a DataFrame. 
         
         Attributes: 
-            See attributes defined for class. """
+            See attributes defined for class. 
             
-        self.info = {}
-        with open(file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                line_data = line.split()
-                name = line_data[0]
-                age = int(line_data[1])
-                immunocompromised = line_data[2]
-                job = line_data[3]
-                preference = line_data[4]
-                zipcode = line_data[5]
-                phase = self.eligible(age, immunocompromised, job)
-                self.info[name] = (name, age, immunocompromised, job, preference, zipcode, phase)
+        Args:
+            file (str): File containing information about the individuals. """
+            
+        df = pd.read_csv(file, sep=r"\s+", header=None,
+                         names=["name", "age", "immunocompromised", "job",
+                                "preference", "zipcode"],
+                         usecols=range(6),
+                         dtype={"name": str, "zipcode": str,
+                                "immunocompromised": "category",
+                                "job": "category", "preference": "category"})
+        df = df.drop_duplicates("name", keep="last")
+        p1_mask = ((df["age"].to_numpy() >= 60)
+                   | _isin_codes(df["job"], list(_PHASE1_JOBS)))
+        p2_mask = ~p1_mask & (_isin_codes(df["immunocompromised"], ["yes"])
+                              | _isin_codes(df["job"], list(_PHASE2_JOBS)))
+        df["phase"] = pd.Categorical.from_codes(
+            np.where(p1_mask, 0, np.where(p2_mask, 1, 2)),
+            categories=list(_PHASES))
+        self.df = df.set_index("name")
+        self.info = _InfoView(self.df)
                 
     def eligible(self, age, immunocompromised, job):
         """Determines which phase the individual on each line of the file is
@@ -58,14 +231,12 @@ class Eligibility:
             str: Outputs the phase in which each individual is eligible for the
             COVID-19 vaccine. """
             
-        phase1_jobs = ["doctor", "nurse", "therapist"]
-        phase2_jobs = ["cashier", "teacher"]
-        if age >= 60 or job in phase1_jobs:
-            return "phase 1"
-        elif immunocompromised == "yes" or job in phase2_jobs:
-            return "phase 2"
+        if age >= 60 or job in _PHASE1_JOBS:
+            return _PHASES[0]
+        elif immunocompromised == "yes" or job in _PHASE2_JOBS:
+            return _PHASES[1]
         else:
-            return  "phase 3"
+            return _PHASES[2]
             
     def __repr__(self):
         """Formal represenation of the class Eligibility. 
@@ -75,24 +246,54 @@ class Eligibility:
             phase they are eligible for. """
         
         string = ""
-        for name in self.info:
-            person = self.info[name]
-            string += name + " " + str(person[6]) + "\n"
+        for name, phase in zip(self.df.index, self.df["phase"]):
+            string += name + " " + phase + "\n"
         return string
     
+@dataclass(slots=True, frozen=True)
+class Site:
+    """A single vaccine site.
+    
+    Attributes:
+        name (str): The name of the vaccine site.
+        zip (str): The zipcode of the vaccine site.
+        lat (float): Latitude of the vaccine site in degrees.
+        lng (float): Longitude of the vaccine site in degrees. """
+        
+    name: str
+    zip: str
+    lat: float
+    lng: float
+
 class Zipcode:
     """Ask the user to input a zipcode and return a list of vaccine clinics 
     in latitude and longitude.
     
+    Zipcodes and vaccine sites are stored column-wise in numpy arrays rather
+    than as a dictionary per row. All distances treat the Earth as a sphere
+    (haversine); the ellipsoidal vincenty formula is not used.
+    
     Attributes: 
-        zipcodes (dict of str): Dictionary of zipcodes and their latitude and 
-        longitude. 
+        _zip_keys (array of str): Every zipcode, sorted for binary search. 
+        
+        _zip_lat, _zip_lng (array of float32): Latitude and longitude of every 
+        zipcode in degrees. 
+        
+        vaccine_locations (dict of Site): Dictionary of vaccine site names and 
+        their records. 
+        
+        _vac_names (array of str): Names of the vaccine sites. 
         
-        vaccine_locations (dict of str): Dictionary of zipcodes and their 
-        latitude and longitude of the vaccine sites. 
+        _vac_lat, _vac_lng (array of float32): Latitude and longitude of every 
+        vaccine site in radians. 
+        
+        _vac_coslat (array of float32): Cosine of every vaccine site 
+        latitude, computed once and reused by every nearest-site scan. 
     
-    Returns: 
-        Dict of floats: Appended dictionary of longitudes and latitudes.  
+    The parsed zipcode arrays are cached next to file1 (file1 + ".cache.npz")
+    and reused while the cache is newer than file1. Only modification times 
+    are compared, so replacing file1 with an older copy (cp -p, tar, rsync -a
+    or a backup restore) keeps the stale cache; delete it in that case. 
     
     Sources:
         Hurst, E. (n.d.). All US zip codes with their corresponding latitude and longitude coordinates. 
@@ -113,25 +314,56 @@ class Zipcode:
             file2 (str): File containing zipcode and location information
             about vaccine locations. """
             
-        self.zipcodes = { }
-        self.vaccine_locations = { }
-        with open(file1, "r", encoding="utf-8") as f:
-            for i in f: 
-                zipdict = { }
-                zip, lat, lng= i.split(",")
-                zipdict["zip"] = zip.strip()
-                zipdict["lat"] = float(lat.strip())
-                zipdict["lng"] = float(lng.strip())
-                self.zipcodes[zip] = zipdict
-        with open(file2, "r", encoding = "utf-8") as f:
-            for i in f:
-                location_dict = { }
-                name, zip, lat, lng = i.split(",")
-                location_dict["name"] = name.strip()
-                location_dict["zip"] = zip.strip()
-                location_dict["lat"] = float(lat.strip())
-                location_dict["lng"] = float(lng.strip())
-                self.vaccine_locations[name] = location_dict
+        zip_cache = file1 + ".cache.npz"
+        cached = _read_cache(zip_cache, file1, _load_zip_arrays)
+        if cached is not None:
+            self._zip_keys, self._zip_lat, self._zip_lng = cached
+        else:
+            z = _read_columns(file1, {"zip": pa.string(), "lat": pa.float32(),
+                                      "lng": pa.float32()})
+            # Sorted keys for binary search; when a zipcode repeats, the last
+            # row wins.
+            zips = z["zip"]
+            self._zip_keys, first = np.unique(zips[::-1], return_index=True)
+            rows = len(zips) - 1 - first
+            _check_latlng(z["lat"], z["lng"], file1)
+            self._zip_lat = z["lat"][rows]
+            self._zip_lng = z["lng"][rows]
+            _write_cache(zip_cache, lambda f: np.savez(
+                f, zip=self._zip_keys, lat=self._zip_lat, lng=self._zip_lng))
+        v = _read_columns(file2, {"name": pa.string(), "zip": pa.string(),
+                                  "lat": pa.float64(), "lng": pa.float64()})
+        self.vaccine_locations = {
+            site.name: site for site in map(Site, v["name"].tolist(),
+                                            v["zip"].tolist(),
+                                            v["lat"].tolist(),
+                                            v["lng"].tolist())}
+        self._vac_names = v["name"]
+        _check_latlng(v["lat"], v["lng"], file2)
+        self._vac_lat = np.deg2rad(v["lat"].astype(np.float32))
+        self._vac_lng = np.deg2rad(v["lng"].astype(np.float32))
+        self._vac_coslat = np.cos(self._vac_lat)
+        self._tree = cKDTree(self._to_xyz(self._vac_lat, self._vac_lng))
+        self.get_latlng = functools.lru_cache(maxsize=4096)(self.get_latlng)
+        self.nearest_by_zip = functools.lru_cache(maxsize=4096)(
+            self.nearest_by_zip)
+
+    @staticmethod
+    def _to_xyz(lat, lng):
+        """Converts radian latitude and longitude to points on the unit sphere.
+        Chord distance between these points orders the same way as
+        great-circle distance.
+        
+        Args:
+            lat (float or array): latitude in radians.
+            lng (float or array): longitude in radians.
+            
+        Returns:
+            array: (..., 3) array of x, y, z coordinates. """
+            
+        coslat = np.cos(lat)
+        return np.stack((coslat * np.cos(lng), coslat * np.sin(lng),
+                         np.sin(lat)), axis=-1)
 
     def get_latlng(self, zipcode):
         """Retrieves the latitude and longitude of the zipcode specified. 
@@ -140,37 +372,88 @@ class Zipcode:
             zipcode (str): The zipcode of the individual. 
             
         Returns: 
-            tuple (str): Returns a tuple of strings, that has that latitude and 
+            tuple (float): Returns a tuple of floats, that has that latitude and 
             longitude of the zipcode. """
             
-        zip = self.zipcodes[zipcode]
-        return (zip["lat"], zip["lng"])
+        i = np.searchsorted(self._zip_keys, zipcode)
+        if i == len(self._zip_keys) or self._zip_keys[i] != zipcode:
+            raise KeyError(zipcode)
+        return (self._zip_lat[i], self._zip_lng[i])
 
     def nearest(self, p1):
         """Compares the latitude and longitude of the individual's zipcode to 
-        vaccine locations and retrieves the closest location. 
+        vaccine locations and retrieves the closest location. Sites are 
+        ranked by great-circle distance on a spherical Earth, which picks the
+        same site as the ellipsoidal distance except for near ties. 
         
         Args: 
             p1 (float): latitude and longitude of the individual's zipcode. 
             
         Returns: 
             nearest_name (str): Returns the name of the nearest vaccine 
-            location. """
+            location, or an empty string if there are no locations. """
             
-        nearest_distance = sys.float_info.max
-        nearest_name = ""
-        for name in self.vaccine_locations:
-            location = self.vaccine_locations[name]
-            p2 = (location["lat"], location["lng"])
-            distance = self.get_dist(p1, p2)
-            if distance < nearest_distance:
-                nearest_distance = distance
-                nearest_name = name
-        return nearest_name
+        if len(self._vac_names) == 0:
+            return ""
+        lat1, lng1 = np.deg2rad(p1)
+        if len(self._vac_names) < _SCAN_MAX_SITES:
+            idx = nearest_site(float(lat1), float(lng1), self._vac_lat,
+                               self._vac_lng, self._vac_coslat)
+        else:
+            _, idx = self._tree.query(self._to_xyz(lat1, lng1), k=1)
+        return str(self._vac_names[idx])
 
+    def nearest_by_zip(self, zipcode):
+        """Retrieves the closest vaccine location to a zipcode. Results are 
+        cached per instance, so individuals sharing a zipcode are only looked
+        up once.
+        
+        Args: 
+            zipcode (str): The zipcode of the individual. 
+            
+        Returns: 
+            str: Returns the name of the nearest vaccine location. """
+            
+        return self.nearest(self.get_latlng(zipcode))
+
+    def nearest_all(self, person_zips):
+        """Finds the nearest vaccine location for many zipcodes at once. Like
+        nearest, small site lists are scanned directly (in parallel once there
+        are enough zipcodes) and larger ones go through the tree.
+        
+        Args:
+            person_zips (list of str): zipcodes of the individuals.
+            
+        Returns:
+            array of str: the name of the nearest vaccine location for each
+            zipcode, in the same order as person_zips; empty strings if there
+            are no vaccine locations. """
+            
+        unique_zips, inverse = np.unique(np.asarray(person_zips, dtype=str),
+                                         return_inverse=True)
+        latlng = np.deg2rad(np.array([self.get_latlng(z) for z in unique_zips],
+                                     dtype=np.float32).reshape(-1, 2))
+        if len(self._vac_names) == 0:
+            return np.full(len(inverse), "")
+        if len(self._vac_names) < _SCAN_MAX_SITES:
+            idx = np.empty(len(latlng), dtype=np.int64)
+            if len(latlng) < _PARALLEL_MIN_QUERIES:
+                for i, (lat1, lng1) in enumerate(latlng):
+                    idx[i] = nearest_site(float(lat1), float(lng1),
+                                          self._vac_lat, self._vac_lng,
+                                          self._vac_coslat)
+            else:
+                nearest_sites_batch(latlng[:, 0], latlng[:, 1], self._vac_lat,
+                                    self._vac_lng, self._vac_coslat, idx)
+        else:
+            _, idx = self._tree.query(
+                self._to_xyz(latlng[:, 0], latlng[:, 1]), k=1, workers=-1)
+        return self._vac_names[idx][inverse]
 
     def get_dist(self, p1, p2, miles=False):
-        """Calculate the distance between two latitude/longitude coordinates.
+        """Calculate the haversine distance between two latitude/longitude
+        coordinates on a spherical Earth. This can differ from the ellipsoidal
+        distance by up to about 0.5%.
         
         Args:
             p1 (float): latitude and longitude of one location.
@@ -179,123 +462,102 @@ class Zipcode:
         
         Returns:
             float: the distance between p1 and p2"""
-        dist = vincenty(p1, p2, miles=miles)
-        if not dist:
-            dist = haversine(p1, p2, unit='mi' if miles else 'km')
+        dist = haversine_km(p1[0], p1[1], p2[0], p2[1])
+        if miles:
+            dist *= EARTH_RADIUS_MI / EARTH_RADIUS_KM
         return dist
 
-def main():
-    """Creates an instance of the Zipcode and Eligibility classes and uses them
-    to methods to find the nearest location. 
-    
-    Side effects: 
-        Prints the nearest zipcode location to the individual's zipcode. 
-        Prints name not found if the user input's a name that is not given in 
-        a list. """
-    zipcode = Zipcode("zipcodes.txt","vaccine_locations.txt")
-    eligibility = combined.Eligibility("fariba.txt")
-    name = input("What is your name? ")
-    if name in eligibility.info:
-        person = eligibility.info[name]
-        person_zipcode = person[5]
-        p1 = zipcode.get_latlng(person_zipcode)
-        nearest_location = zipcode.nearest(p1)
-        print (nearest_location)
-    else:
-        print("Name not found")
-
-
-if __name__ == "__main__":
-    main()
-
-def main():
-    """Creates instance of Eligibility class to be able to use it's methods. 
-    
-    Side effects: 
-        Prints the instance of the Eligibility class. """
-        
-    eligibility = Eligibility("fariba.txt")
-    print(eligibility)
-
-
-def graphyes(file):
-    """Uses the file to provide a graph that indicates how many individual 
-    would take the vaccine. 
+def plot_vaccine(eligibility):
+    """Uses the individuals' information to provide graphs that indicate how 
+    many individuals would and would not take the vaccine. 
     
     Args: 
-        file (str): A file that contains information about the individuals. 
+        eligibility (Eligibility): The parsed information about the 
+        individuals. 
         
     Returns:
-        A graph that indicates individuals who are willing to get the vaccine 
-        compared to their ages. 
+        Two graphs, side by side, that indicate individuals who are and are 
+        not willing to get the vaccine compared to their ages. 
     
     Sources: 
-    https://pandas.pydata.org/docs/reference/api/pandas.cut.html: line 242,
-    Allowed me to use the cut method of the pandas. This would allow for there 
-    to be separation of ages in bins on the x-axis. 
+    https://pandas.pydata.org/docs/reference/api/pandas.cut.html: 
+    Defines the age bins on the x-axis; they are now counted with 
+    np.searchsorted and np.bincount using the same right-inclusive edges. 
     
     https://www.geeksforgeeks.org/plotting-multiple-bar-charts-using-matplotlib
-    -in-python/ : lines 240-244, allowed me to develop the code for 
-    production of two bars for each x-axis label, using two sets of data. 
+    -in-python/ : allowed me to develop the code for production of two bars 
+    for each x-axis label, using two sets of data. 
     
-    https://datatofish.com/bar-chart-python-matplotlib/ : lines 245-248, allowed
-    me to learn about the different methods you can use from the plt class to 
-    edit the bar graph.
+    https://datatofish.com/bar-chart-python-matplotlib/ : allowed me to learn 
+    about the different methods you can use from the plt class to edit the bar
+    graph.
     
     https://www.easytweaks.com/pandas-read-text-files/. 
     This source taught me how to take information from a text file and create a dataframe using that information"""
         
-    df = pd.read_csv(file, delimiter =' ', names =['name', 'age', 'immunocompromised', 'job', 'will take vaccine?', 'zipcode'], index_col = False)
-    dfyes = df[df["age"] < 1000][df["will take vaccine?"] == 'yes'][["will take vaccine?", "age"]]
-    dfyes["Age Group"] = pd.cut(x=df['age'], bins = [0, 25, 50, 75, 100], labels = ["18-24", "25-44", "45-64", "65-80"])
-    immuno = dfyes.groupby("Age Group")['will take vaccine?'].count()
-    graph = immuno.plot.bar(x = "Age Group", y = 'will take vaccine?')
-    plt.title("Individuals Who Would Take The Vaccine")
-    plt.xlabel("Age Groups")
-    plt.ylabel("Number of People")
+    df = eligibility.df
+    labels = ["18-24", "25-44", "45-64", "65-80"]
+    # Bins are right-inclusive like pd.cut: (0, 25], (25, 50], ... Ages 
+    # outside (0, 100] fall out of range and are not counted.
+    bins = np.searchsorted(np.array([0, 25, 50, 75, 100]),
+                           df["age"].to_numpy(), side="left") - 1
+    in_range = (bins >= 0) & (bins < len(labels))
+    will = _isin_codes(df["preference"], ["yes"])
+    wont = _isin_codes(df["preference"], ["no"])
+    yes_counts = np.bincount(bins[in_range & will], minlength=len(labels))
+    no_counts = np.bincount(bins[in_range & wont], minlength=len(labels))
+    _, (axyes, axno) = plt.subplots(1, 2, sharey=True)
+    axyes.bar(np.arange(len(labels)), yes_counts)
+    axyes.set_title("Individuals Who Would Take The Vaccine")
+    axno.bar(np.arange(len(labels)), no_counts)
+    axno.set_title("Individuals Who Would Not Take The Vaccine")
+    for ax in (axyes, axno):
+        ax.set_xticks(np.arange(len(labels)), labels)
+        ax.set_xlabel("Age Groups")
+    axyes.set_ylabel("Number of People")
     final = plt.show()
     return final
 
-def graphno(file):
-    """Uses the file to provide a graph that indicates how many individual 
-    would not take the vaccine. 
+def main(argv=None):
+    """Runs one of the command line modes. By default, asks for a name and
+    finds the nearest vaccine location for that individual. 
     
-    Args: 
-        file (str): A file that contains information about the individuals. 
-        
-    Returns:
-        A graph that indicates individuals who are not willing to get the 
-        vaccine compared to their ages.
-        
-    Sources: 
-    https://pandas.pydata.org/docs/reference/api/pandas.cut.html: line 277,
-    Allowed me to use the cut method of the pandas. This would allow for there 
-    to be separation of ages in bins on the x-axis. 
+    Args:
+        argv (list of str): Command line arguments; sys.argv is used when
+        not given. 
     
-    https://www.geeksforgeeks.org/plotting-multiple-bar-charts-using-matplotlib
-    -in-python/ : lines 279-282, allowed me to develop the code for 
-    production of two bars for each x-axis label, using two sets of data. 
-    
-    https://datatofish.com/bar-chart-python-matplotlib/ : lines 279-282, allowed
-    me to learn about the different methods you can use from the plt class to 
-    edit the bar graph.
-    
-    https://www.easytweaks.com/pandas-read-text-files/. 
-    This source taught me how to take information from a text file and create a dataframe using that information
-"""
-         
-    df = pd.read_csv(file, delimiter =' ', names =['name', 'age', 'immunocompromised', 'job', 'will take vaccine?', 'zipcode'], index_col = False)
-    dfno = df[df["age"] < 1000][df["will take vaccine?"] == 'no'][["will take vaccine?", "age"]]
-    dfno["Age Group"] = pd.cut(x=df['age'], bins = [0, 25, 50, 75, 100], labels = ["18-24", "25-44", "45-64", "65-80"])
-    immuno = dfno.groupby("Age Group")['will take vaccine?'].count()
-    graph = immuno.plot.bar(x = "Age Group", y = 'will take vaccine?')
-    plt.title("Individuals Who Would Not Take The Vaccine")
-    plt.xlabel("Age Groups")
-    plt.ylabel("Number of People")
-    final = plt.show()
-    return final
+    Side effects: 
+        --lookup (default): Prints the nearest vaccine location to the 
+        individual's zipcode, or name not found if the user inputs a name 
+        that is not in the file. 
+        --phases: Prints every individual and the phase they are eligible for.
+        --plot: Shows the graphs of who would and would not take the vaccine. 
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--lookup", action="store_true",
+                      help="find the nearest vaccine site for a name")
+    mode.add_argument("--phases", action="store_true",
+                      help="print the vaccine phase of every individual")
+    mode.add_argument("--plot", action="store_true",
+                      help="graph vaccine willingness by age group")
+    args = parser.parse_args(argv)
+    eligibility = Eligibility("fariba.txt")
+    if args.phases:
+        print(eligibility)
+    elif args.plot:
+        plot_vaccine(eligibility)
+    else:
+        zipcode = Zipcode("zipcodes.txt","vaccine_locations.txt")
+        name = input("What is your name? ")
+        if name in eligibility.info:
+            person = eligibility.info[name]
+            person_zipcode = person[5]
+            nearest_location = zipcode.nearest_by_zip(person_zipcode)
+            print (nearest_location)
+        else:
+            print("Name not found")
+
+if __name__ == "__main__":
+    main()
 
-graph1 = graphyes("fariba.txt")
-graph2 = graphno("fariba.txt")
-print(graph1)   
-print(graph2)
\ No newline at end of file